@@ -15,13 +15,20 @@ from .registry import (
     PokeStreamReader,
     PokeStreamWriter,
     pykm3_decode,
+    pykm3_decode_many,
     pykm3_encode,
+    pykm3_encode_many,
     pykm3_search_function,
 )
 
 # Register the codec when this module is imported
 codecs.register(pykm3_search_function)
 
+# Warm the codecs lookup cache, so the first encode/decode is a dict hit
+for _name in ("pykm3", "pykm3jap"):
+    codecs.lookup(_name)
+del _name
+
 # Define what symbols are exported when using "from pykm3_codec import *"
 __all__ = [
     "ByteConverter",
@@ -33,6 +40,8 @@ __all__ = [
     "JapanesePokeTextCodec",
     "pykm3_encode",
     "pykm3_decode",
+    "pykm3_encode_many",
+    "pykm3_decode_many",
     "PokeStreamReader",
     "PokeStreamWriter",
     "pykm3_search_function",
@@ -0,0 +1,88 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython implementation of the codec inner loops.
+
+This extension is optional: it is built by setup.py when Cython and a C
+compiler are available, and the codecs fall back to their pure Python
+path otherwise.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+
+
+cdef extern from "Python.h":
+    int PyUnicode_4BYTE_KIND
+    object PyUnicode_FromKindAndData(int kind, const void *buffer, Py_ssize_t size)
+
+
+def encode_bytes(str text, const short[::1] lut, int fallback, unsigned char terminator):
+    """
+    Encode a string, appending the terminator.
+
+    Unknown characters are replaced by ``fallback``, or dropped when it is
+    negative. Returns the encoded bytes and the index of the first unknown
+    character (-1 if there was none).
+    """
+    cdef Py_ssize_t n = len(text)
+    cdef Py_ssize_t size = lut.shape[0]
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t first_unknown = -1
+    cdef bytes out = PyBytes_FromStringAndSize(NULL, n + 1)
+    cdef unsigned char *buf = <unsigned char *>PyBytes_AS_STRING(out)
+    cdef Py_UCS4 char
+    cdef int value
+
+    for char in text:
+        value = lut[char] if char < size else -1
+        if value < 0:
+            if first_unknown < 0:
+                first_unknown = i
+            value = fallback
+        if value >= 0:
+            buf[j] = <unsigned char>value
+            j += 1
+        i += 1
+
+    buf[j] = terminator
+    if j < n:
+        out = out[: j + 1]
+    return out, first_unknown
+
+
+def decode_bytes(
+    const unsigned char[::1] data, const int[::1] lut, unsigned char terminator,
+    int replacement
+):
+    """
+    Decode bytes into a string, stopping at the terminator.
+
+    Unknown bytes are replaced by ``replacement``, or dropped when it is
+    negative. Returns the decoded string and the index of the first unknown
+    byte (-1 if there was none).
+    """
+    cdef Py_ssize_t n = data.shape[0]
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t first_unknown = -1
+    cdef int codepoint
+    cdef Py_UCS4 *buf = <Py_UCS4 *>PyMem_Malloc((n + 1) * sizeof(Py_UCS4))
+    if buf is NULL:
+        raise MemoryError()
+
+    try:
+        for i in range(n):
+            if data[i] == terminator:
+                break
+            codepoint = lut[data[i]]
+            if codepoint < 0:
+                if first_unknown < 0:
+                    first_unknown = i
+                codepoint = replacement
+            if codepoint >= 0:
+                buf[j] = <Py_UCS4>codepoint
+                j += 1
+        return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, buf, j), first_unknown
+    finally:
+        PyMem_Free(buf)
@@ -0,0 +1,128 @@
+"""
+Numba-compiled kernels for encoding and decoding long texts.
+
+This module is optional: importing it requires both numpy and numba, and
+the codecs fall back to their pure Python path when it is unavailable.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+from numba import njit
+
+
+def build_encode_lut(table: Dict[int, int]) -> np.ndarray:
+    """
+    Build a codepoint to byte lookup table for the encode kernel.
+
+    Args:
+        table: Mapping from character ordinals to encoded bytes
+
+    Returns:
+        An int16 array indexed by codepoint, with -1 for unknown characters
+    """
+    lut = np.full(max(table) + 1, -1, dtype=np.int16)
+    for codepoint, byte in table.items():
+        lut[codepoint] = byte
+    return lut
+
+
+def build_decode_lut(chars: list) -> np.ndarray:
+    """
+    Build a byte to codepoint lookup table for the decode kernel.
+
+    Args:
+        chars: List of 256 decoded characters, None for unknown bytes
+
+    Returns:
+        An int32 array indexed by byte, with -1 for unknown bytes
+    """
+    return np.array([-1 if char is None else ord(char) for char in chars], np.int32)
+
+
+@njit(cache=True, boundscheck=False)
+def encode_kernel(codepoints, lut, fallback, terminator):
+    """
+    Encode an array of codepoints, appending the terminator.
+
+    Unknown characters are replaced by ``fallback``, or dropped when it is
+    negative. Returns the encoded array and the index of the first unknown
+    character (-1 if there was none).
+    """
+    n = codepoints.shape[0]
+    size = lut.shape[0]
+    out = np.empty(n + 1, np.uint8)
+    first_unknown = -1
+    j = 0
+    for i in range(n):
+        codepoint = codepoints[i]
+        value = lut[codepoint] if codepoint < size else -1
+        if value < 0:
+            if first_unknown < 0:
+                first_unknown = i
+            if fallback < 0:
+                continue
+            value = fallback
+        out[j] = value
+        j += 1
+    out[j] = terminator
+    return out[: j + 1], first_unknown
+
+
+@njit(cache=True, boundscheck=False)
+def decode_kernel(data, lut, terminator, replacement):
+    """
+    Decode an array of bytes into codepoints, stopping at the terminator.
+
+    Unknown bytes are replaced by ``replacement``, or dropped when it is
+    negative. Returns the codepoint array and the index of the first unknown
+    byte (-1 if there was none).
+    """
+    n = data.shape[0]
+    out = np.empty(n, np.uint32)
+    first_unknown = -1
+    j = 0
+    for i in range(n):
+        byte = data[i]
+        if byte == terminator:
+            break
+        codepoint = lut[byte]
+        if codepoint < 0:
+            if first_unknown < 0:
+                first_unknown = i
+            if replacement < 0:
+                continue
+            codepoint = replacement
+        out[j] = codepoint
+        j += 1
+    return out[:j], first_unknown
+
+
+def encode(
+    text: str, lut: np.ndarray, fallback: int, terminator: int
+) -> Tuple[bytes, int]:
+    """
+    Encode a string with :func:`encode_kernel`.
+
+    Returns:
+        The encoded bytes and the index of the first unknown character
+    """
+    codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), np.uint32)
+    out, first_unknown = encode_kernel(codepoints, lut, fallback, terminator)
+    return out.tobytes(), first_unknown
+
+
+def decode(
+    data: bytes, lut: np.ndarray, terminator: int, replacement: int
+) -> Tuple[str, int]:
+    """
+    Decode bytes with :func:`decode_kernel`.
+
+    Returns:
+        The decoded string and the index of the first unknown byte
+    """
+    codepoints, first_unknown = decode_kernel(
+        np.frombuffer(data, np.uint8), lut, terminator, replacement
+    )
+    # Decode straight from the array buffer instead of copying it to bytes
+    return str(codepoints.data, "utf-32-le"), first_unknown
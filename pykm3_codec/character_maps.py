@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 
 
 class CharacterMap:
@@ -8,10 +8,20 @@ class CharacterMap:
     TERMINATOR = 0xFF
     LINE_BREAK = 0xFE
 
+    # Maps built so far, by class
+    _maps: Dict[type, Tuple[Dict[int, str], Dict[str, int]]] = {}
+
     def __init__(self):
         """Initialize the character maps."""
-        self.byte_to_char = self._get_byte_to_char_map()
-        self.char_to_byte = {k: v for v, k in self.byte_to_char.items()}
+        # The maps only depend on the class, so they are built once per class;
+        # each instance gets its own copies, which it may modify
+        maps = CharacterMap._maps.get(type(self))
+        if maps is None:
+            byte_to_char = self._get_byte_to_char_map()
+            char_to_byte = {k: v for v, k in byte_to_char.items()}
+            maps = CharacterMap._maps[type(self)] = (byte_to_char, char_to_byte)
+        self.byte_to_char = dict(maps[0])
+        self.char_to_byte = dict(maps[1])
 
     def _get_byte_to_char_map(self) -> Dict[int, str]:
         """
@@ -1,9 +1,151 @@
+import os
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
 from .character_maps import CharacterMap, JapaneseCharacterMap, WesternCharacterMap
 
+try:
+    from . import _fast
+except ImportError:  # the Cython extension is optional
+    _fast = None
+
+# Importing numba and compiling the kernels takes about half a second, which
+# only pays off for bulk work, so the kernels are opt-in; once enabled, they
+# are imported when a text is first long enough to use them
+_NOT_IMPORTED = object()
+_numba_kernels = _NOT_IMPORTED if os.environ.get("PYKM3_CODEC_NUMBA") == "1" else None
+
+# Below this length str.translate beats the array round-trip of the kernels
+_NUMBA_MIN_LENGTH = 64
+
+
+def _get_numba_kernels() -> Optional[ModuleType]:
+    """Import the Numba kernels on first use, None if disabled or unavailable."""
+    global _numba_kernels
+    if _numba_kernels is _NOT_IMPORTED:
+        try:
+            from . import _numba_kernels as kernels
+        except ImportError:  # numpy and numba are optional
+            kernels = None
+        _numba_kernels = kernels
+    return _numba_kernels
+
+
+class _UnknownCharacter(Exception):
+    """Raised by a strict translate table when a character is not mapped."""
+
+
+class _EncodeTable(dict):
+    """Translate table that maps unknown characters to a fallback value."""
+
+    def __init__(self, mapping: Dict[int, int], fallback: Optional[int]):
+        super().__init__(mapping)
+        self.fallback = fallback
+
+    def __missing__(self, key: int) -> Optional[int]:
+        return self.fallback
+
+
+class _StrictEncodeTable(dict):
+    """Translate table that aborts on the first unknown character."""
+
+    def __missing__(self, key: int) -> int:
+        raise _UnknownCharacter(key)
+
+
+class _ByErrors(dict):
+    """Tables keyed by error strategy, unknown strategies behave as 'replace'."""
+
+    def __missing__(self, key: str):
+        return self["replace"]
+
+
+class _CodecTables:
+    """Lookup tables derived from a character map."""
+
+    __slots__ = (
+        "terminator",
+        "encode_tables",
+        "decode_tables",
+        "known_bytes",
+        "ascii_lut",
+        "ascii_unknown",
+        "ascii_known",
+        "fast_encode_lut",
+        "fast_decode_lut",
+        "_numba_luts",
+    )
+
+    def __init__(self, char_map: CharacterMap):
+        self.terminator = bytes((char_map.TERMINATOR,))
+
+        # str.translate tables, one per error handling strategy
+        table = {ord(char): byte for char, byte in char_map.char_to_byte.items()}
+        table[ord("\n")] = char_map.LINE_BREAK
+        self.encode_tables = _ByErrors(
+            strict=_StrictEncodeTable(table),
+            replace=_EncodeTable(table, char_map.char_to_byte.get(" ", 0x00)),
+            ignore=_EncodeTable(table, None),
+        )
+
+        # bytes.translate tables for pure ASCII input
+        fallback = self.encode_tables["replace"].fallback
+        self.ascii_lut = bytes(table.get(i, fallback) for i in range(128)) + bytes(128)
+        self.ascii_unknown = bytes(i for i in range(128) if i not in table)
+        self.ascii_known = bytes(i for i in range(128) if i in table)
+
+        # Decode lists indexed by byte value, one per error handling strategy
+        chars = [char_map.byte_to_char.get(byte) for byte in range(256)]
+        chars[char_map.LINE_BREAK] = "\n"
+        replace = ["?" if char is None else char for char in chars]
+        self.decode_tables = _ByErrors(
+            # Strict decoding checks for unknown bytes before using its table
+            strict=replace,
+            replace=replace,
+            ignore=["" if char is None else char for char in chars],
+        )
+        self.known_bytes = bytes(b for b, char in enumerate(chars) if char is not None)
+
+        if _fast is not None:
+            self.fast_encode_lut = array("h", [-1]) * (max(table) + 1)
+            for codepoint, byte in table.items():
+                self.fast_encode_lut[codepoint] = byte
+            self.fast_decode_lut = array(
+                "i", [-1 if char is None else ord(char) for char in chars]
+            )
+        self._numba_luts = None
+
+    def numba_luts(self, kernels: ModuleType) -> tuple:
+        """
+        Get the lookup arrays of the Numba kernels, building them on first use.
+
+        Args:
+            kernels: The imported Numba kernels module
+
+        Returns:
+            The encode and decode lookup arrays
+        """
+        if self._numba_luts is None:
+            known = frozenset(self.known_bytes)
+            chars = [
+                char if byte in known else None
+                for byte, char in enumerate(self.decode_tables["replace"])
+            ]
+            self._numba_luts = (
+                kernels.build_encode_lut(self.encode_tables["strict"]),
+                kernels.build_decode_lut(chars),
+            )
+        return self._numba_luts
+
 
 class PokeTextCodec:
     """Base class for Pokémon text codecs."""
 
+    __slots__ = ("char_map", "_tables")
+
     def __init__(self, char_map: CharacterMap):
         """
         Initialize the codec with a character map.
@@ -12,6 +154,21 @@ class PokeTextCodec:
             char_map: The character map to use
         """
         self.char_map = char_map
+        self._tables = _CodecTables(char_map)
+
+    def _init_shared(self, map_class: type) -> None:
+        """
+        Initialize with the map and tables shared by every instance of the class.
+
+        Args:
+            map_class: The character map class, instantiated on first use
+        """
+        cls = type(self)
+        shared = cls.__dict__.get("_shared")
+        if shared is None:
+            char_map = map_class()
+            shared = cls._shared = (char_map, _CodecTables(char_map))
+        self.char_map, self._tables = shared
 
     def encode(self, text: str, errors: str = "replace") -> bytes:
         """
@@ -28,30 +185,39 @@ class PokeTextCodec:
         Returns:
             bytes: The encoded Pokémon text as a byte sequence.
         """
-        result = bytearray()
-
-        for i, char in enumerate(text):
-            if char == "\n":
-                result.append(self.char_map.LINE_BREAK)
-            elif char in self.char_map.char_to_byte:
-                result.append(self.char_map.char_to_byte[char])
-            else:
-                # Handle unknown chars according to the errors parameter
-                if errors == "strict":
-                    raise UnicodeEncodeError(
-                        "pykm3", text, i, i + 1, f"Invalid char: {char}"
-                    )
-                elif errors == "replace":
-                    result.append(self.char_map.char_to_byte.get(" ", 0x00))
-                elif errors == "ignore":
-                    pass  # Skip this char
-                else:
-                    # Default fallback
-                    result.append(self.char_map.char_to_byte.get(" ", 0x00))
-
-        # Add terminator
-        result.append(self.char_map.TERMINATOR)
-        return bytes(result)
+        tables = self._tables
+        if text.isascii():
+            # Pure ASCII maps byte for byte; in strict mode unknown characters
+            # fall through so that the general path reports them
+            ascii_bytes = text.encode("ascii")
+            if errors != "strict" or not ascii_bytes.translate(
+                None, tables.ascii_known
+            ):
+                delete = tables.ascii_unknown if errors == "ignore" else b""
+                encoded = ascii_bytes.translate(tables.ascii_lut, delete)
+                return encoded + tables.terminator
+
+        if _fast is not None:
+            return self._encode_compiled(
+                _fast.encode_bytes, tables.fast_encode_lut, text, errors
+            )
+        kernels = _get_numba_kernels() if len(text) >= _NUMBA_MIN_LENGTH else None
+        if kernels is not None:
+            return self._encode_compiled(
+                kernels.encode, tables.numba_luts(kernels)[0], text, errors
+            )
+
+        table = tables.encode_tables[errors]
+        try:
+            translated = text.translate(table)
+        except _UnknownCharacter as exc:
+            i = text.index(chr(exc.args[0]))
+            raise UnicodeEncodeError(
+                "pykm3", text, i, i + 1, f"Invalid char: {text[i]}"
+            ) from None
+
+        # Every mapped value fits in a byte, so latin-1 is a 1:1 copy
+        return translated.encode("latin-1") + tables.terminator
 
     def decode(self, data: bytes, errors: str = "strict") -> str:
         """
@@ -68,48 +234,160 @@ class PokeTextCodec:
         Returns:
             str: The decoded string.
         """
-        result = []
-        i = 0
-
-        while i < len(data):
-            byte = data[i]
-
-            if byte == self.char_map.TERMINATOR:
-                break  # Stop at terminator
-            elif byte == self.char_map.LINE_BREAK:
-                result.append("\n")
-            elif byte in self.char_map.byte_to_char:
-                result.append(self.char_map.byte_to_char[byte])
-            else:
-                # Handle unknown bytes according to the errors parameter
-                if errors == "strict":
-                    raise UnicodeDecodeError(
-                        "pykm3", data, i, i + 1, f"Invalid byte: {byte}"
-                    )
-                elif errors == "replace":
-                    result.append("?")
-                elif errors == "ignore":
-                    pass  # Skip this byte
-                else:
-                    # Default fallback
-                    result.append("?")
-
-            i += 1
-
-        return "".join(result)
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)  # bytes.decode hands codecs a memoryview
+
+        # Trim at the terminator first (memchr), so that a short text inside a
+        # large buffer neither walks nor allocates for the trailing bytes
+        tables = self._tables
+        end = data.find(tables.terminator)
+        prefix = data if end < 0 else data[:end]
+
+        if _fast is not None:
+            return self._decode_compiled(
+                _fast.decode_bytes, tables.fast_decode_lut, data, prefix, errors
+            )
+        kernels = _get_numba_kernels() if len(prefix) >= _NUMBA_MIN_LENGTH else None
+        if kernels is not None:
+            return self._decode_compiled(
+                kernels.decode, tables.numba_luts(kernels)[1], data, prefix, errors
+            )
+
+        if errors == "strict":
+            # Deleting every known byte leaves the unknown ones, in order
+            unknown = prefix.translate(None, tables.known_bytes)
+            if unknown:
+                i = prefix.index(unknown[0])
+                raise UnicodeDecodeError(
+                    "pykm3", data, i, i + 1, f"Invalid byte: {data[i]}"
+                )
+
+        table = tables.decode_tables[errors]
+        return "".join(map(table.__getitem__, prefix))
+
+    def encode_many(self, texts: Iterable[str], errors: str = "replace") -> List[bytes]:
+        """
+        Encode several strings with a single pass of the encoder.
+
+        Args:
+            texts (Iterable[str]): The strings to encode.
+            errors (str, optional): Error handling strategy, as in encode.
+
+        Returns:
+            List[bytes]: The encoded strings, each with its own terminator.
+        """
+        texts = list(texts)
+        if errors == "ignore":
+            # Dropped characters break the one byte per character layout
+            return [self.encode(text, errors) for text in texts]
+
+        offsets = list(accumulate(map(len, texts)))
+        try:
+            joined = self.encode("".join(texts), errors)
+        except UnicodeEncodeError as exc:
+            k = bisect_right(offsets, exc.start)
+            start = exc.start - (offsets[k - 1] if k else 0)
+            raise UnicodeEncodeError(
+                "pykm3", texts[k], start, start + 1, exc.reason
+            ) from None
+
+        terminator = self._tables.terminator
+        return [
+            joined[start:end] + terminator
+            for start, end in zip(chain((0,), offsets), offsets)
+        ]
+
+    def decode_many(self, datas: Iterable[bytes], errors: str = "strict") -> List[str]:
+        """
+        Decode several byte sequences with a single pass of the decoder.
+
+        Args:
+            datas (Iterable[bytes]): The encoded byte sequences.
+            errors (str, optional): Error handling strategy, as in decode.
+
+        Returns:
+            List[str]: The decoded strings.
+        """
+        if errors == "ignore":
+            # Dropped bytes break the one character per byte layout
+            return [self.decode(data, errors) for data in datas]
+
+        terminator = self._tables.terminator
+        prefixes = []
+        for data in datas:
+            if not isinstance(data, (bytes, bytearray)):
+                data = bytes(data)
+            end = data.find(terminator)
+            prefixes.append(data if end < 0 else data[:end])
+
+        offsets = list(accumulate(map(len, prefixes)))
+        try:
+            joined = self.decode(b"".join(prefixes), errors)
+        except UnicodeDecodeError as exc:
+            k = bisect_right(offsets, exc.start)
+            start = exc.start - (offsets[k - 1] if k else 0)
+            raise UnicodeDecodeError(
+                "pykm3", prefixes[k], start, start + 1, exc.reason
+            ) from None
+
+        return [joined[start:end] for start, end in zip(chain((0,), offsets), offsets)]
+
+    def _encode_compiled(
+        self, kernel: Callable[..., Tuple[bytes, int]], lut, text: str, errors: str
+    ) -> bytes:
+        """Encode through a compiled kernel, with the same semantics as encode."""
+        if errors in ("strict", "ignore"):
+            fallback = -1
+        else:
+            fallback = self._tables.encode_tables["replace"].fallback
+
+        encoded, i = kernel(text, lut, fallback, self.char_map.TERMINATOR)
+        if errors == "strict" and i >= 0:
+            raise UnicodeEncodeError(
+                "pykm3", text, i, i + 1, f"Invalid char: {text[i]}"
+            )
+        return encoded
+
+    def _decode_compiled(
+        self,
+        kernel: Callable[..., Tuple[str, int]],
+        lut,
+        data: bytes,
+        prefix: bytes,
+        errors: str,
+    ) -> str:
+        """Decode the prefix of data through a compiled kernel, as decode does."""
+        replacement = -1 if errors in ("strict", "ignore") else ord("?")
+
+        decoded, i = kernel(prefix, lut, self.char_map.TERMINATOR, replacement)
+        if errors == "strict" and i >= 0:
+            raise UnicodeDecodeError(
+                "pykm3", data, i, i + 1, f"Invalid byte: {data[i]}"
+            )
+        return decoded
 
 
 class WesternPokeTextCodec(PokeTextCodec):
     """Codec for Western Pokémon text."""
 
+    __slots__ = ()
+
+    # Character map and tables shared by every instance, built on first use
+    _shared: Optional[Tuple[CharacterMap, _CodecTables]] = None
+
     def __init__(self):
         """Initialize with Western character map."""
-        super().__init__(WesternCharacterMap())
+        self._init_shared(WesternCharacterMap)
 
 
 class JapanesePokeTextCodec(PokeTextCodec):
     """Codec for Japanese Pokémon text."""
 
+    __slots__ = ()
+
+    # Character map and tables shared by every instance, built on first use
+    _shared: Optional[Tuple[CharacterMap, _CodecTables]] = None
+
     def __init__(self):
         """Initialize with Japanese character map."""
-        super().__init__(JapaneseCharacterMap())
+        self._init_shared(JapaneseCharacterMap)
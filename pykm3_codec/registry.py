@@ -1,8 +1,50 @@
 import codecs
-from typing import Optional, Tuple
-
-from .character_maps import JapaneseCharacterMap, WesternCharacterMap
-from .pk_codecs import JapanesePokeTextCodec, WesternPokeTextCodec
+from functools import partial
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .character_maps import CharacterMap, JapaneseCharacterMap, WesternCharacterMap
+from .pk_codecs import JapanesePokeTextCodec, PokeTextCodec, WesternPokeTextCodec
+
+# Shared codecs and detection sets, built once at import time
+_WESTERN_CODEC = WesternPokeTextCodec()
+_JAP_CODEC = JapanesePokeTextCodec()
+_JAP_CHARS: FrozenSet[str] = frozenset(JapaneseCharacterMap().byte_to_char.values())
+_WEST_CHARS: FrozenSet[str] = frozenset(WesternCharacterMap().byte_to_char.values())
+_JAP_ONLY_BYTES: FrozenSet[int] = frozenset(range(0x00, 0xA1)) - frozenset(
+    WesternCharacterMap().byte_to_char.keys()
+)
+_TERMINATOR = bytes((CharacterMap.TERMINATOR,))
+# Deleting every other byte leaves only the Japanese-only ones behind
+_NON_JAP_BYTES = bytes(byte for byte in range(256) if byte not in _JAP_ONLY_BYTES)
+
+
+def _detect_text_codec(text: str) -> PokeTextCodec:
+    """Pick the codec for a string: Japanese only if Western can't encode it."""
+    # The Japanese map has no ASCII characters, so ASCII text is always Western
+    # (str.isascii is O(1) on CPython, it reads a flag of the string object)
+    if text.isascii():
+        return _WESTERN_CODEC
+
+    # One pass over the text, then the subset checks only touch distinct chars
+    chars = set(text)
+
+    if chars <= _JAP_CHARS and not chars <= _WEST_CHARS:
+        return _JAP_CODEC
+    return _WESTERN_CODEC
+
+
+def _detect_data_codec(data: bytes) -> PokeTextCodec:
+    """Pick the codec for encoded bytes: Japanese if any byte is Japanese-only."""
+    # Try to determine encoding based on byte patterns
+    # This is a simple heuristic - first check for characteristic JAP bytes
+    # If any bytes are in the Japanese-only range, use Japanese codec
+    # Only the bytes before the terminator are decoded, so only those count
+    end = data.find(_TERMINATOR)
+    if end >= 0:
+        data = data[:end]
+    if data.translate(None, _NON_JAP_BYTES):
+        return _JAP_CODEC
+    return _WESTERN_CODEC
 
 
 # Python codec registration functions
@@ -21,18 +63,10 @@ def pykm3_encode(
     Returns:
         A tuple containing the encoded bytes and the length of the input
     """
-    jap_chars = set(JapaneseCharacterMap()._get_byte_to_char_map().values())
-    west_chars = set(WesternCharacterMap()._get_byte_to_char_map().values())
-
-    all_chars_in_jap = all(char in jap_chars for char in text)
-    any_chars_not_in_western = any(char not in west_chars for char in text)
+    if not text:
+        return _TERMINATOR, 0
 
-    if all_chars_in_jap and any_chars_not_in_western:
-        codec = JapanesePokeTextCodec()
-    else:
-        codec = WesternPokeTextCodec()
-
-    encoded = codec.encode(text, errors)
+    encoded = _detect_text_codec(text).encode(text, errors)
     return encoded, len(text)
 
 
@@ -51,8 +85,7 @@ def pykm3_jap_encode(
     Returns:
         A tuple containing the encoded bytes and the length of the input
     """
-    codec = JapanesePokeTextCodec()
-    encoded = codec.encode(text, errors)
+    encoded = _JAP_CODEC.encode(text, errors)
     return encoded, len(text)
 
 
@@ -71,21 +104,26 @@ def pykm3_decode(
     Returns:
         A tuple containing the decoded string and the length of the input
     """
-    # Try to determine encoding based on byte patterns
-    # This is a simple heuristic - first check for characteristic JAP bytes
-    japanese_chars = set(range(0x00, 0xA1)) - set(
-        WesternCharacterMap()._get_byte_to_char_map().keys()
-    )
-
-    # If any bytes are in the Japanese-only range, use Japanese codec
-    for byte in data:
-        if byte in japanese_chars:
-            codec = JapanesePokeTextCodec()
-            break
-    else:
-        codec = WesternPokeTextCodec()
-
-    decoded = codec.decode(data, errors)
+    # Empty input, or a text that ends right away (e.g. a blank 0xFF-filled
+    # field), decodes to an empty string whatever the language
+    if data[:1] in (b"", _TERMINATOR):
+        return "", len(data)
+
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+
+    # Trim at the terminator once, so that detection and decoding share one
+    # prefix instead of each slicing their own copy of it
+    end = data.find(_TERMINATOR)
+    prefix = data if end < 0 else data[:end]
+
+    try:
+        decoded = _detect_data_codec(prefix).decode(prefix, errors)
+    except UnicodeDecodeError as exc:
+        # Report the caller's whole buffer; the prefix starts at the same offset
+        raise UnicodeDecodeError(
+            exc.encoding, data, exc.start, exc.end, exc.reason
+        ) from None
     return decoded, len(data)
 
 
@@ -104,11 +142,62 @@ def pykm3_jap_decode(
     Returns:
         A tuple containing the decoded string and the length of the input
     """
-    codec = JapanesePokeTextCodec()
-    decoded = codec.decode(data, errors)
+    decoded = _JAP_CODEC.decode(data, errors)
     return decoded, len(data)
 
 
+def pykm3_encode_many(texts: Iterable[str], errors: str = "strict") -> List[bytes]:
+    """
+    Encode several strings using the Pokémon Generation III format.
+    Each string is auto-detected as in pykm3_encode, and the strings that
+    share a codec are encoded together in a single pass.
+
+    Args:
+        texts: The strings to encode
+        errors: Error handling scheme
+
+    Returns:
+        The encoded bytes of each string, in input order
+    """
+    texts = list(texts)
+    groups: Dict[PokeTextCodec, List[int]] = {}
+    for i, text in enumerate(texts):
+        groups.setdefault(_detect_text_codec(text), []).append(i)
+
+    result = [b""] * len(texts)
+    for codec, indexes in groups.items():
+        encoded = codec.encode_many([texts[i] for i in indexes], errors)
+        for i, item in zip(indexes, encoded):
+            result[i] = item
+    return result
+
+
+def pykm3_decode_many(datas: Iterable[bytes], errors: str = "strict") -> List[str]:
+    """
+    Decode several byte sequences using the Pokémon Generation III format.
+    Each sequence is auto-detected as in pykm3_decode, and the sequences that
+    share a codec are decoded together in a single pass.
+
+    Args:
+        datas: The byte sequences to decode
+        errors: Error handling scheme
+
+    Returns:
+        The decoded string of each sequence, in input order
+    """
+    datas = [data if isinstance(data, bytes) else bytes(data) for data in datas]
+    groups: Dict[PokeTextCodec, List[int]] = {}
+    for i, data in enumerate(datas):
+        groups.setdefault(_detect_data_codec(data), []).append(i)
+
+    result = [""] * len(datas)
+    for codec, indexes in groups.items():
+        decoded = codec.decode_many([datas[i] for i in indexes], errors)
+        for i, item in zip(indexes, decoded):
+            result[i] = item
+    return result
+
+
 class PokeStreamWriter(codecs.StreamWriter):
     """Base stream writer for the pykm3 codec."""
 
@@ -116,6 +205,19 @@ class PokeStreamWriter(codecs.StreamWriter):
         super().__init__(stream, errors)
         self.encode_func = encode_func
 
+    def encode(self, input, errors="strict"):
+        """
+        Encode input using the pykm3 codec.
+
+        Args:
+            input: The text to encode
+            errors: Error handling scheme
+
+        Returns:
+            A tuple containing the encoded bytes and the length of the input
+        """
+        return self.encode_func(input, errors)
+
     def write(self, text):
         """
         Write the given text to the stream.
@@ -129,7 +231,7 @@ class PokeStreamWriter(codecs.StreamWriter):
         if not isinstance(text, str):
             text = str(text)
 
-        encoded_data, length = self.encode_func(text, self.errors)
+        encoded_data, length = self.encode(text, self.errors)
         self.stream.write(encoded_data)
         return length
 
@@ -168,38 +270,43 @@ def create_stream_reader(stream, errors="strict", japanese=False):
     return PokeStreamReader(stream, decode_func, errors)
 
 
+_western_stream_reader = partial(create_stream_reader, japanese=False)
+_western_stream_writer = partial(create_stream_writer, japanese=False)
+_japanese_stream_reader = partial(create_stream_reader, japanese=True)
+_japanese_stream_writer = partial(create_stream_writer, japanese=True)
+
+
+_WESTERN_CODEC_INFO = codecs.CodecInfo(
+    name="pykm3",
+    encode=pykm3_encode,
+    decode=pykm3_decode,
+    streamreader=_western_stream_reader,
+    streamwriter=_western_stream_writer,
+)
+_JAP_CODEC_INFO = codecs.CodecInfo(
+    name="pykm3jap",
+    encode=pykm3_jap_encode,
+    decode=pykm3_jap_decode,
+    streamreader=_japanese_stream_reader,
+    streamwriter=_japanese_stream_writer,
+)
+_CODEC_INFOS: Dict[str, codecs.CodecInfo] = {
+    "pykm3": _WESTERN_CODEC_INFO,
+    "pykm3codec": _WESTERN_CODEC_INFO,
+    "pykm3jap": _JAP_CODEC_INFO,
+    "pykm3japanese": _JAP_CODEC_INFO,
+}
+
+
 def pykm3_search_function(encoding: str) -> Optional[codecs.CodecInfo]:
     """
     Search function for the pykm3 codec.
 
     Args:
-        encoding: The encoding name
+        encoding: The encoding name, case-insensitive
 
     Returns:
         CodecInfo if the encoding matches, None otherwise
     """
-    if encoding.lower() in ("pykm3", "pykm3codec"):
-        return codecs.CodecInfo(
-            name="pykm3",
-            encode=pykm3_encode,
-            decode=pykm3_decode,
-            streamreader=lambda stream, errors="strict": create_stream_reader(
-                stream, errors, japanese=False
-            ),
-            streamwriter=lambda stream, errors="strict": create_stream_writer(
-                stream, errors, japanese=False
-            ),
-        )
-    elif encoding.lower() in ("pykm3jap", "pykm3japanese"):
-        return codecs.CodecInfo(
-            name="pykm3jap",
-            encode=pykm3_jap_encode,
-            decode=pykm3_jap_decode,
-            streamreader=lambda stream, errors="strict": create_stream_reader(
-                stream, errors, japanese=True
-            ),
-            streamwriter=lambda stream, errors="strict": create_stream_writer(
-                stream, errors, japanese=True
-            ),
-        )
-    return None
+    # codecs.lookup already lowercases the name, direct callers may not
+    return _CODEC_INFOS.get(encoding) or _CODEC_INFOS.get(encoding.lower())
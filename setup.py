@@ -0,0 +1,24 @@
+import os
+
+from setuptools import Extension, setup
+
+ext_modules = []
+
+# The Cython extension is opt-in, so that the published wheel stays pure Python
+if os.environ.get("PYKM3_CODEC_BUILD_EXT") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        cythonize = None
+
+    if cythonize is not None and os.path.exists("pykm3_codec/_fast.pyx"):
+        ext_modules = cythonize("pykm3_codec/_fast.pyx", language_level=3)
+    elif os.path.exists("pykm3_codec/_fast.c"):
+        # Fall back to the C file generated for the sdist
+        ext_modules = [Extension("pykm3_codec._fast", ["pykm3_codec/_fast.c"])]
+
+    for extension in ext_modules:
+        # Without a C compiler the package still installs as pure Python
+        extension.optional = True
+
+setup(ext_modules=ext_modules)
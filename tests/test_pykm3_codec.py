@@ -1,14 +1,17 @@
 import codecs
-import os
-import sys
-import tempfile
+import io
 import unittest
+from unittest import mock
 
 import pykm3_codec
-from pykm3_codec import ByteConverter, JapanesePokeTextCodec, WesternPokeTextCodec
-
-# Add the parent directory to the path
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+from pykm3_codec import (
+    ByteConverter,
+    JapanesePokeTextCodec,
+    PokeTextCodec,
+    WesternCharacterMap,
+    WesternPokeTextCodec,
+)
+from pykm3_codec import pk_codecs
 
 
 class TestByteConverter(unittest.TestCase):
@@ -16,30 +19,35 @@ class TestByteConverter(unittest.TestCase):
 
     def test_to_int(self):
         """Test conversion from bytes to int."""
-        self.assertEqual(ByteConverter.to_int(b"\x01\x02"), 513)
-        self.assertEqual(ByteConverter.to_int(b"\xff"), 255)
-        self.assertEqual(ByteConverter.to_int(b"\x00\x00"), 0)
-        self.assertEqual(ByteConverter.to_int(b"\xff\xff"), 65535)
-        self.assertEqual(ByteConverter.to_int(b"\xff\xff\xa9\x0d"), 229244927)
+        cases = [
+            (b"\x01\x02", 513),
+            (b"\xff", 255),
+            (b"\x00\x00", 0),
+            (b"\xff\xff", 65535),
+            (b"\xff\xff\xa9\x0d", 229244927),
+        ]
+        for data, value in cases:
+            with self.subTest(data=data):
+                self.assertEqual(ByteConverter.to_int(data), value)
         # test errors
-        with self.assertRaises(TypeError):
-            ByteConverter.to_int("asd")
-        with self.assertRaises(TypeError):
-            ByteConverter.to_int(0)
+        for data in ("asd", 0):
+            with self.subTest(data=data), self.assertRaises(TypeError):
+                ByteConverter.to_int(data)
 
     def test_from_int(self):
         """Test conversion from int to bytes."""
-        self.assertEqual(ByteConverter.from_int(513, 2), b"\x01\x02")
-        self.assertEqual(ByteConverter.from_int(255, 1), b"\xff")
-        self.assertEqual(ByteConverter.from_int(0, 2), b"\x00\x00")
-        self.assertEqual(ByteConverter.from_int(229244927, 4), b"\xff\xff\xa9\x0d")
-        # test padding
-        self.assertEqual(
-            ByteConverter.from_int(258496712, 6), b"\xc8\x58\x68\x0f\x00\x00"
-        )
-        self.assertEqual(
-            ByteConverter.from_int(0, 8), b"\x00\x00\x00\x00\x00\x00\x00\x00"
-        )
+        cases = [
+            (513, 2, b"\x01\x02"),
+            (255, 1, b"\xff"),
+            (0, 2, b"\x00\x00"),
+            (229244927, 4, b"\xff\xff\xa9\x0d"),
+            # test padding
+            (258496712, 6, b"\xc8\x58\x68\x0f\x00\x00"),
+            (0, 8, b"\x00\x00\x00\x00\x00\x00\x00\x00"),
+        ]
+        for value, length, data in cases:
+            with self.subTest(value=value, length=length):
+                self.assertEqual(ByteConverter.from_int(value, length), data)
         # test errors
         invalid_inputs = [
             ("asd", 1),
@@ -52,7 +60,7 @@ class TestByteConverter(unittest.TestCase):
             ([0, 1], 1 + 3),
         ]
         for value, bit_size in invalid_inputs:
-            with self.assertRaises(
+            with self.subTest(value=value, bit_size=bit_size), self.assertRaises(
                 (TypeError, AttributeError, OverflowError, ValueError)
             ):
                 ByteConverter.from_int(value, bit_size)
@@ -147,9 +155,18 @@ class TestJapaneseCodec(unittest.TestCase):
 class TestCodecRegistration(unittest.TestCase):
     """Tests for codec registration and usage through the standard interface."""
 
-    def setUp(self):
-        """Register the codec for testing."""
-        codecs.register(pykm3_codec.pykm3_search_function)
+    def test_registered_on_import(self):
+        """Test that importing the package is enough to look the codecs up."""
+        self.assertEqual(codecs.lookup("pykm3").name, "pykm3")
+        self.assertEqual(codecs.lookup("pykm3jap").name, "pykm3jap")
+
+    def test_search_function_is_case_insensitive(self):
+        """Test calling the search function directly with any case."""
+        self.assertIs(
+            pykm3_codec.pykm3_search_function("PYKM3"),
+            pykm3_codec.pykm3_search_function("pykm3"),
+        )
+        self.assertIsNone(pykm3_codec.pykm3_search_function("utf-8"))
 
     def test_encode_decode_western(self):
         """Test encoding and decoding Western text through the registered codec."""
@@ -165,24 +182,43 @@ class TestCodecRegistration(unittest.TestCase):
         decoded = encoded.decode("pykm3jap")
         self.assertEqual(decoded, "ピカチュウの　１０まんボルト！")
 
+    def test_encode_decode_many(self):
+        """Test batch encoding and decoding of mixed Western and Japanese texts."""
+        texts = [
+            "PIKACHU",
+            "",
+            "ピカチュウ",
+            "used THUNDERBOLT!\nIt's super effective!",
+        ]
+        encoded = pykm3_codec.pykm3_encode_many(texts)
+        self.assertEqual(encoded, [text.encode("pykm3") for text in texts])
+        self.assertEqual(pykm3_codec.pykm3_decode_many(encoded), texts)
+
+        codec = WesternPokeTextCodec()
+        with self.assertRaises(UnicodeEncodeError) as ctx:
+            codec.encode_many(["Hi", "Hi 😊"], "strict")
+        self.assertEqual((ctx.exception.object, ctx.exception.start), ("Hi 😊", 3))
+        self.assertEqual(
+            codec.decode_many([b"\xc2\xff\x18", b"\x18\xdd"], "replace"), ["H", "?i"]
+        )
+
     def test_stream_io_western(self):
         """Test reading and writing using stream IO."""
         text = "PROF. OAK: Hello there!\nWelcome to the world of POKéMON!"
 
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            filename = f.name
+        buffer = io.BytesIO()
+        codecs.getwriter("pykm3")(buffer).write(text)
+        buffer.seek(0)
+        content = codecs.getreader("pykm3")(buffer).read()
 
-        try:
-            with codecs.open(filename, "w", "pykm3") as f:
-                f.write(text)
+        self.assertEqual(content, text)
 
-            with codecs.open(filename, "r", "pykm3") as f:
-                content = f.read()
-
-            self.assertEqual(content, text)
-        finally:
-            if os.path.exists(filename):
-                os.remove(filename)
+    def test_stream_codec_methods(self):
+        """Test the encode/decode methods exposed by the stream classes."""
+        writer = codecs.getwriter("pykm3")(io.BytesIO())
+        reader = codecs.getreader("pykm3")(io.BytesIO())
+        self.assertEqual(writer.encode("Hi"), (b"\xc2\xdd\xff", 2))
+        self.assertEqual(reader.decode(b"\xc2\xdd\xff"), ("Hi", 3))
 
     def test_stream_io_japanese(self):
         """Test reading and writing using stream IO."""
@@ -190,20 +226,12 @@ class TestCodecRegistration(unittest.TestCase):
             "オーキド　ハカセ：コンニチハ！\nポケットモンスターノ　セカイヘ　ヨウコソ！"
         )
 
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            filename = f.name
-
-        try:
-            with codecs.open(filename, "w", "pykm3jap") as f:
-                f.write(text)
+        buffer = io.BytesIO()
+        codecs.getwriter("pykm3jap")(buffer).write(text)
+        buffer.seek(0)
+        content = codecs.getreader("pykm3jap")(buffer).read()
 
-            with codecs.open(filename, "r", "pykm3jap") as f:
-                content = f.read()
-
-            self.assertEqual(content, text)
-        finally:
-            if os.path.exists(filename):
-                os.remove(filename)
+        self.assertEqual(content, text)
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -232,6 +260,21 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(self.western_codec.decode(self.western_codec.encode("")), "")
         self.assertEqual(self.japanese_codec.decode(self.japanese_codec.encode("")), "")
 
+    def test_long_text_round_trip(self):
+        """Test long texts, which take a compiled path when one is available."""
+        western = self.WESTERN_CHARACTERS * 50
+        japanese = self.JAPANESE_CHARACTERS * 50
+        self.assertEqual(
+            self.western_codec.decode(self.western_codec.encode(western)), western
+        )
+        self.assertEqual(
+            self.japanese_codec.decode(self.japanese_codec.encode(japanese)), japanese
+        )
+        with self.assertRaises(UnicodeEncodeError):
+            self.western_codec.encode(western + "😊", "strict")
+        self.assertEqual(western.encode("pykm3").decode("pykm3"), western)
+        self.assertEqual(japanese.encode("pykm3").decode("pykm3"), japanese)
+
     def test_unsupported_characters(self):
         """Test handling of unsupported characters."""
         text_with_unsupported = "Hello 😊 World ⚡ PikáChU!"  # Emoji is unsupported
@@ -246,6 +289,61 @@ class TestEdgeCases(unittest.TestCase):
         decoded = encoded.decode("pykm3", errors="replace")
         self.assertEqual(decoded, "Hello   World   PikáChU!")
 
+    def test_encode_error_schemes(self):
+        """Test every error scheme of the encoder on unsupported characters."""
+        text = "Hi 😊!"
+        self.assertEqual(
+            self.western_codec.encode(text, "replace"), b"\xc2\xdd\x00\x00\xab\xff"
+        )
+        self.assertEqual(
+            self.western_codec.encode(text, "ignore"), b"\xc2\xdd\x00\xab\xff"
+        )
+        with self.assertRaises(UnicodeEncodeError) as ctx:
+            self.western_codec.encode(text, "strict")
+        self.assertEqual((ctx.exception.start, ctx.exception.end), (3, 4))
+
+    def test_encode_error_schemes_ascii(self):
+        """Test every error scheme of the encoder on unsupported ASCII characters."""
+        text = "Hi ~!"
+        self.assertEqual(
+            self.western_codec.encode(text, "replace"), b"\xc2\xdd\x00\x00\xab\xff"
+        )
+        self.assertEqual(
+            self.western_codec.encode(text, "ignore"), b"\xc2\xdd\x00\xab\xff"
+        )
+        with self.assertRaises(UnicodeEncodeError) as ctx:
+            self.western_codec.encode(text, "strict")
+        self.assertEqual((ctx.exception.start, ctx.exception.end), (3, 4))
+
+    def test_decode_error_schemes(self):
+        """Test every error scheme of the decoder on unmapped bytes."""
+        data = b"\xc2\x18\xdd\xff\x18"
+        self.assertEqual(self.western_codec.decode(data, "replace"), "H?i")
+        self.assertEqual(self.western_codec.decode(data, "ignore"), "Hi")
+        with self.assertRaises(UnicodeDecodeError) as ctx:
+            self.western_codec.decode(data, "strict")
+        self.assertEqual((ctx.exception.start, ctx.exception.end), (1, 2))
+
+    def test_custom_character_map(self):
+        """Test that a codec uses the character map instance it is given."""
+        char_map = WesternCharacterMap()
+        char_map.char_to_byte = {"A": 0xBB}
+        char_map.byte_to_char = {0xBB: "A"}
+        codec = PokeTextCodec(char_map)
+        self.assertEqual(codec.encode("AB", "replace"), b"\xbb\x00\xff")
+        self.assertEqual(codec.decode(b"\xbb\xbc\xff", "replace"), "A?")
+        # The stock maps are left untouched
+        self.assertEqual(WesternCharacterMap().char_to_byte["B"], 0xBC)
+        self.assertEqual(self.western_codec.encode("AB"), b"\xbb\xbc\xff")
+
+    def test_decode_error_reports_whole_input(self):
+        """Test that registry decode errors carry the caller's whole buffer."""
+        data = b"\xc2\xf7\xdd\xff\x00\x00"
+        with self.assertRaises(UnicodeDecodeError) as ctx:
+            data.decode("pykm3")
+        self.assertEqual(ctx.exception.object, data)
+        self.assertEqual((ctx.exception.start, ctx.exception.end), (1, 2))
+
     def test_incomplete_data(self):
         """Test decoding of incomplete data (no terminator)."""
         self.assertEqual(self.western_codec.decode(b"\xc2\xbf\xc6\xc6\xc9"), "HELLO")
@@ -258,6 +356,10 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(western_encoded.decode("pykm3"), self.WESTERN_CHARACTERS)
         self.assertEqual(japanese_encoded.decode("pykm3"), self.JAPANESE_CHARACTERS)
 
+    def test_detection_ignores_bytes_after_terminator(self):
+        """Test that padding after the terminator does not affect detection."""
+        self.assertEqual(b"\xc2\xdd\xff\x4a\x4a".decode("pykm3"), "Hi")
+
     def test_all_western_characters_substrings(self):
         """Test encoding creating all possible substrings of all western characters."""
         test_string = self.WESTERN_CHARACTERS
@@ -305,5 +407,84 @@ class TestEdgeCases(unittest.TestCase):
             test_string.encode("pykm3")
 
 
+class TestImplementations(unittest.TestCase):
+    """Run the same checks on the Cython, Numba and pure Python paths."""
+
+    # Long enough for the Numba kernels, which skip shorter texts
+    PADDING = "A" * pk_codecs._NUMBA_MIN_LENGTH
+    PADDING_BYTES = b"\xbb" * pk_codecs._NUMBA_MIN_LENGTH
+
+    def setUp(self):
+        """Set up codec instances for testing."""
+        self.western_codec = WesternPokeTextCodec()
+        self.japanese_codec = JapanesePokeTextCodec()
+
+    def check_round_trip(self):
+        """Check that long Western and Japanese texts survive a round trip."""
+        western = TestEdgeCases.WESTERN_CHARACTERS * 2
+        japanese = TestEdgeCases.JAPANESE_CHARACTERS * 2
+        self.assertEqual(
+            self.western_codec.decode(self.western_codec.encode(western)), western
+        )
+        self.assertEqual(
+            self.japanese_codec.decode(self.japanese_codec.encode(japanese)), japanese
+        )
+
+    def check_encode_error_schemes(self):
+        """Check every error scheme of the encoder on a long text."""
+        text = "Hi 😊!" + self.PADDING
+        self.assertEqual(
+            self.western_codec.encode(text, "replace"),
+            b"\xc2\xdd\x00\x00\xab" + self.PADDING_BYTES + b"\xff",
+        )
+        self.assertEqual(
+            self.western_codec.encode(text, "ignore"),
+            b"\xc2\xdd\x00\xab" + self.PADDING_BYTES + b"\xff",
+        )
+        with self.assertRaises(UnicodeEncodeError) as ctx:
+            self.western_codec.encode(text, "strict")
+        self.assertEqual((ctx.exception.start, ctx.exception.end), (3, 4))
+
+    def check_decode_error_schemes(self):
+        """Check every error scheme of the decoder on long data."""
+        data = b"\xc2\x18\xdd" + self.PADDING_BYTES + b"\xff\x18"
+        self.assertEqual(
+            self.western_codec.decode(data, "replace"), "H?i" + self.PADDING
+        )
+        self.assertEqual(self.western_codec.decode(data, "ignore"), "Hi" + self.PADDING)
+        with self.assertRaises(UnicodeDecodeError) as ctx:
+            self.western_codec.decode(data, "strict")
+        self.assertEqual((ctx.exception.start, ctx.exception.end), (1, 2))
+        self.assertEqual(ctx.exception.object, data)
+
+    def check_all(self):
+        """Run every check on the current path."""
+        self.check_round_trip()
+        self.check_encode_error_schemes()
+        self.check_decode_error_schemes()
+
+    def test_cython(self):
+        """Test the Cython extension."""
+        if pk_codecs._fast is None:
+            self.skipTest("the Cython extension is not built")
+        self.check_all()
+
+    def test_numba(self):
+        """Test the Numba kernels."""
+        with mock.patch.object(pk_codecs, "_fast", None), mock.patch.object(
+            pk_codecs, "_numba_kernels", pk_codecs._NOT_IMPORTED
+        ):
+            if pk_codecs._get_numba_kernels() is None:
+                self.skipTest("numba is not installed")
+            self.check_all()
+
+    def test_pure_python(self):
+        """Test the pure Python fallback."""
+        with mock.patch.object(pk_codecs, "_fast", None), mock.patch.object(
+            pk_codecs, "_numba_kernels", None
+        ):
+            self.check_all()
+
+
 if __name__ == "__main__":
     unittest.main()